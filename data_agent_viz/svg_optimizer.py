@@ -0,0 +1,352 @@
+import math
+import re
+import xml.etree.ElementTree as ET
+
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+
+# Significant digits kept for coordinates, relative to the viewBox size
+# (an 800 wide chart keeps 2 decimals, a 0.004 wide one keeps 7)
+COORD_DIGITS = 5
+
+# Never round below this many decimals, whatever the viewBox size, so
+# stroke widths, font sizes and 0-1 fractions survive on large canvases
+MIN_DECIMALS = 2
+
+# Transform coefficients multiply geometry, so they keep relative precision
+TRANSFORM_DIGITS = 6
+
+# Attributes whose numbers are coordinates or lengths in user units
+NUMERIC_ATTRS = frozenset({
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry",
+    "dx", "dy", "width", "height", "points", "viewBox",
+    "stroke-width", "font-size",
+})
+TRANSFORM_ATTRS = frozenset({"transform", "gradientTransform", "patternTransform"})
+
+# Elements whose own geometry defaults to fractions of the bounding box
+BOUNDING_BOX_UNITS = {
+    "linearGradient": "gradientUnits",
+    "radialGradient": "gradientUnits",
+    "filter": "filterUnits",
+    "pattern": "patternUnits",
+    "mask": "maskUnits",
+}
+# Elements whose content is in bounding-box fractions only when asked for
+BOUNDING_BOX_CONTENT_UNITS = {
+    "clipPath": "clipPathUnits",
+    "mask": "maskContentUnits",
+    "pattern": "patternContentUnits",
+}
+
+# Elements whose character data is rendered, so whitespace must be kept
+TEXT_CONTAINERS = frozenset({"text", "tspan", "textPath", "title", "desc", "style"})
+
+PATH_COMMANDS = frozenset("MmLlHhVvCcSsQqTtAaZz")
+
+NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+LENGTH_RE = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+))(?:px)?\s*$")
+# A DOCTYPE in the prolog; group 2 is "[" when it carries an internal subset
+DOCTYPE_RE = re.compile(
+    r"^(\s*(?:<\?xml.*?\?>)?(?:\s*<!--.*?-->)*\s*)<!DOCTYPE\b[^\[>]*([\[>])", re.DOTALL
+)
+
+
+class SvgValidationError(ValueError):
+    """Raised when the SVG markup is malformed or structurally invalid."""
+
+
+def _local_name(name):
+    """Splits an ElementTree '{ns}name' into (ns, name)."""
+    if name.startswith("{"):
+        ns, _, local = name[1:].partition("}")
+        return ns, local
+    return "", name
+
+
+def _format_number(value, precision):
+    text = f"{round(float(value), precision):.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def _round_numbers(value, format_number):
+    """Rounds every number in an attribute value, keeping adjacent numbers separated."""
+    def repl(match):
+        out = format_number(match.group(0))
+        start = match.start()
+        # "1.5.5" is two numbers; once rewritten they need a separator
+        if start and (value[start - 1].isdigit() or value[start - 1] == "."):
+            out = " " + out
+        return out
+    return NUMBER_RE.sub(repl, value)
+
+
+def _round_path(d, precision):
+    """
+    Validates and rounds path data, reading arc flags as single digits ("a5 5 0 015 5").
+    A precision of None only validates and normalizes separators.
+    """
+    out = []
+    pos = 0
+    command = ""
+    index = 0
+    while pos < len(d):
+        char = d[pos]
+        if char in " \t\r\n,":
+            pos += 1
+            continue
+        if char.isalpha():
+            if char not in PATH_COMMANDS:
+                raise SvgValidationError(f"Invalid path data near '{d[pos:pos + 20]}'.")
+            if not command and char not in "Mm":
+                raise SvgValidationError(f"Path data must start with a moveto (M/m), got '{d[pos:pos + 20]}'.")
+            command = char
+            index = 0
+            out.append(char)
+            pos += 1
+            continue
+        if not command:
+            raise SvgValidationError(f"Path data must start with a moveto (M/m), got '{d[pos:pos + 20]}'.")
+        if command in ("A", "a") and index % 7 in (3, 4) and char in "01":
+            token = char
+            pos += 1
+        else:
+            match = NUMBER_RE.match(d, pos)
+            if not match:
+                raise SvgValidationError(f"Invalid path data near '{d[pos:pos + 20]}'.")
+            token = match.group(0) if precision is None else _format_number(match.group(0), precision)
+            pos = match.end()
+        if out and not out[-1].isalpha() and not token.startswith("-"):
+            out.append(" ")
+        out.append(token)
+        index += 1
+    return "".join(out)
+
+
+def _format_significant(value):
+    text = f"{float(value):.{TRANSFORM_DIGITS}g}"
+    return "0" if text == "-0" else text
+
+
+def _normalize_style(style):
+    rules = [rule.strip() for rule in style.split(";")]
+    return ";".join(re.sub(r"\s*:\s*", ":", rule) for rule in rules if rule)
+
+
+def _uses_bounding_box(elem, tag):
+    units = BOUNDING_BOX_UNITS.get(tag)
+    return units is not None and elem.get(units) != "userSpaceOnUse"
+
+
+def _content_uses_bounding_box(elem, tag):
+    units = BOUNDING_BOX_CONTENT_UNITS.get(tag)
+    return units is not None and elem.get(units) == "objectBoundingBox"
+
+
+def _keeps_whitespace(elem, tag):
+    return tag in TEXT_CONTAINERS or elem.get(f"{{{XML_NS}}}space") == "preserve"
+
+
+def _validate_viewbox(root):
+    """Validates (or derives) the viewBox and returns its larger dimension."""
+    view_box = root.get("viewBox")
+    if view_box is not None:
+        parts = NUMBER_RE.findall(view_box)
+        if len(parts) != 4 or NUMBER_RE.sub("", view_box).strip(" ,"):
+            raise SvgValidationError(f"viewBox must contain exactly four numbers, got '{view_box}'.")
+        if float(parts[2]) <= 0 or float(parts[3]) <= 0:
+            raise SvgValidationError(f"viewBox width and height must be positive, got '{view_box}'.")
+        return max(float(parts[2]), float(parts[3]))
+
+    # Derive the viewBox from plain width/height so the chart scales in the UI
+    width = LENGTH_RE.match(root.get("width", ""))
+    height = LENGTH_RE.match(root.get("height", ""))
+    if not (width and height) or float(width.group(1)) <= 0 or float(height.group(1)) <= 0:
+        raise SvgValidationError("The <svg> element needs a viewBox (or numeric width and height).")
+    root.set("viewBox", f"0 0 {width.group(1)} {height.group(1)}")
+    return max(float(width.group(1)), float(height.group(1)))
+
+
+def _strip_doctype(svg_code):
+    match = DOCTYPE_RE.match(svg_code)
+    if not match:
+        return svg_code
+    if match.group(2) == "[":
+        raise SvgValidationError("DOCTYPE internal subsets and ENTITY declarations are not allowed in the SVG.")
+    return match.group(1) + svg_code[match.end():]
+
+
+def _remove_keeping_tail(parent, elem):
+    index = list(parent).index(elem)
+    if elem.tail:
+        if index:
+            previous = parent[index - 1]
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
+
+def optimize_svg(svg_code: str, digits: int = COORD_DIGITS) -> str:
+    """
+    Validates and minifies an SVG document in a single streaming parse.
+    Args:
+        svg_code: The raw SVG string produced by the model.
+        digits: Significant digits to keep for coordinates, relative to the viewBox size.
+    Returns:
+        The optimized SVG string.
+    Raises:
+        SvgValidationError: If the markup is malformed or not a usable SVG.
+    """
+    if not svg_code or not svg_code.strip():
+        raise SvgValidationError("The SVG string is empty.")
+    svg_code = _strip_doctype(svg_code.strip())
+
+    # Comments and processing instructions are dropped by the default TreeBuilder
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    precision = 0
+    stack = []
+    preserve_depth = 0
+    bounding_box_depth = 0
+    foreign_object_depth = 0
+    foreign = []
+    styled = []
+    has_stylesheet = False
+
+    try:
+        parser.feed(svg_code)
+        parser.close()
+        for event, elem in parser.read_events():
+            ns, tag = _local_name(elem.tag)
+            is_foreign_object = tag == "foreignObject" and ns in ("", SVG_NS)
+            if event == "start":
+                if root is None:
+                    if tag != "svg" or ns not in ("", SVG_NS):
+                        raise SvgValidationError(f"Root element must be <svg>, got <{tag}>.")
+                    root = elem
+                    # Validate the original viewBox before anything is rounded
+                    size = _validate_viewbox(root)
+                    precision = max(MIN_DECIMALS, digits - 1 - math.floor(math.log10(size)))
+                if _keeps_whitespace(elem, tag):
+                    preserve_depth += 1
+                if _content_uses_bounding_box(elem, tag):
+                    bounding_box_depth += 1
+                if is_foreign_object:
+                    foreign_object_depth += 1
+                stack.append((elem, ns))
+                continue
+
+            stack.pop()
+            parent, parent_ns = stack[-1] if stack else (None, None)
+            keeps_whitespace = _keeps_whitespace(elem, tag)
+            if keeps_whitespace:
+                preserve_depth -= 1
+            if is_foreign_object:
+                foreign_object_depth -= 1
+            if _content_uses_bounding_box(elem, tag):
+                bounding_box_depth -= 1
+            # Only root user-space geometry shares the root viewBox precision; nested
+            # viewBoxes and bounding-box fractions are in other units and kept as written
+            round_geometry = bounding_box_depth == 0 and not _uses_bounding_box(elem, tag)
+
+            if foreign_object_depth:
+                # XHTML (or nested SVG) labels: keep as-is, declaring the namespace where it changes
+                elem.tag = tag
+                if ns and ns != parent_ns:
+                    elem.set("xmlns", ns)
+                for name, value in list(elem.attrib.items()):
+                    attr_ns, attr = _local_name(name)
+                    if attr_ns:
+                        del elem.attrib[name]
+                        if attr_ns == XML_NS:
+                            elem.set(f"xml:{attr}", value)
+                        elif attr_ns == XLINK_NS:
+                            elem.set(f"xlink:{attr}", value)
+                continue
+
+            if ns not in ("", SVG_NS):
+                # Editor metadata (Inkscape, Sketch, ...) is never rendered
+                foreign.append((parent, elem))
+                continue
+            elem.tag = tag
+
+            for name, value in list(elem.attrib.items()):
+                attr_ns, attr = _local_name(name)
+                if attr_ns == XLINK_NS:
+                    del elem.attrib[name]
+                    elem.set(f"xlink:{attr}", value)
+                elif attr_ns == XML_NS:
+                    del elem.attrib[name]
+                    elem.set(f"xml:{attr}", value)
+                elif attr_ns:
+                    del elem.attrib[name]
+                elif attr == "d":
+                    elem.set(attr, _round_path(value, precision if round_geometry else None))
+                elif attr == "viewBox" and elem is not root:
+                    pass
+                elif attr in NUMERIC_ATTRS:
+                    if round_geometry:
+                        elem.set(attr, _round_numbers(value, lambda n: _format_number(n, precision)))
+                elif attr in TRANSFORM_ATTRS:
+                    elem.set(attr, _round_numbers(value, _format_significant))
+                elif attr == "style":
+                    style = _normalize_style(value)
+                    if style:
+                        elem.set("style", style)
+                        styled.append(elem)
+                    else:
+                        del elem.attrib["style"]
+
+            if tag == "style":
+                has_stylesheet = True
+            # preserve_depth now only counts ancestors, so check the element itself too
+            if preserve_depth == 0 and not keeps_whitespace and not is_foreign_object:
+                if elem.text and not elem.text.strip():
+                    elem.text = None
+                for child in elem:
+                    if child.tail and not child.tail.strip():
+                        child.tail = None
+    except ET.ParseError as e:
+        raise SvgValidationError(f"Malformed SVG markup: {e}") from None
+
+    # Drop the foreign elements, moving their tail text onto what precedes them
+    for parent, elem in foreign:
+        _remove_keeping_tail(parent, elem)
+
+    if not len(root):
+        raise SvgValidationError("The SVG has no drawable content.")
+
+    # Hoist repeated inline styles into classes, counting only elements still in
+    # the tree. An author stylesheet could outrank a class rule where the inline
+    # style used to win, so leave those alone.
+    attached = set(root.iter())
+    styled = [elem for elem in styled if elem in attached]
+    if not has_stylesheet:
+        counts = {}
+        for elem in styled:
+            counts[elem.get("style")] = counts.get(elem.get("style"), 0) + 1
+        classes = {}
+        for style, count in counts.items():
+            if count > 1:
+                classes[style] = f"s{len(classes)}"
+        for elem in styled:
+            name = classes.get(elem.get("style"))
+            if name:
+                del elem.attrib["style"]
+                existing = elem.get("class")
+                elem.set("class", f"{existing} {name}" if existing else name)
+        if classes:
+            sheet = ET.Element("style")
+            sheet.text = "".join(f".{name}{{{style}}}" for style, name in classes.items())
+            root.insert(0, sheet)
+
+    root.set("xmlns", SVG_NS)
+    if any(name.startswith("xlink:") for elem in attached for name in elem.attrib):
+        root.set("xmlns:xlink", XLINK_NS)
+    # ElementTree escapes ">" in text and attributes, so " />" only ever closes a tag
+    return ET.tostring(root, encoding="unicode", short_empty_elements=True).replace(" />", "/>")
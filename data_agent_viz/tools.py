@@ -6,6 +6,7 @@ from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
 from google.genai import types
 from google.adk.tools.tool_context import ToolContext
+from .svg_optimizer import optimize_svg, SvgValidationError
   
 
 
@@ -25,14 +26,20 @@ def get_bq_toolset():
 
 async def save_graph_artifact(svg_code: str, tool_context: ToolContext) -> Any:
     """
-    Saves the generated SVG code as an artifact and returns it for display.
+    Validates and optimizes the generated SVG code, saves it as an artifact and returns it for display.
     Args:
         svg_code: The raw SVG string for the visualization (NOT Python code).
         tool_context: The tool context for saving artifacts.
     Returns:
-        A types.Part object containing the SVG image.
+        A types.Part object containing the SVG image, or an error dict if the SVG is invalid.
     """
     print(f"DEBUG: save_graph_artifact called with {len(svg_code)} chars of SVG")
+    # Validate and minify before storing so the UI receives a clean <svg> document
+    try:
+        svg_code = optimize_svg(svg_code)
+    except SvgValidationError as e:
+        return {"status": "error", "error_message": f"Invalid SVG, nothing was saved: {e} Fix the markup and call save_graph_artifact again."}
+
     # Encode SVG to bytes
     svg_bytes = svg_code.encode('utf-8')
     
@@ -0,0 +1,183 @@
+import pytest
+
+from data_agent_viz.svg_optimizer import SvgValidationError, optimize_svg
+
+
+def test_malformed_markup_is_rejected():
+    with pytest.raises(SvgValidationError, match="Malformed"):
+        optimize_svg('<svg viewBox="0 0 10 10"><rect></svg>')
+
+
+def test_empty_string_is_rejected():
+    with pytest.raises(SvgValidationError, match="empty"):
+        optimize_svg("  ")
+
+
+def test_non_svg_root_is_rejected():
+    with pytest.raises(SvgValidationError, match="Root element must be <svg>"):
+        optimize_svg("<div><rect/></div>")
+
+
+def test_invalid_viewbox_is_rejected():
+    with pytest.raises(SvgValidationError, match="positive"):
+        optimize_svg('<svg viewBox="0 0 0 10"><rect/></svg>')
+
+
+def test_missing_viewbox_and_size_is_rejected():
+    with pytest.raises(SvgValidationError, match="viewBox"):
+        optimize_svg("<svg><rect/></svg>")
+
+
+def test_viewbox_is_derived_from_width_and_height():
+    out = optimize_svg('<svg width="800px" height="500"><rect/></svg>')
+    assert 'viewBox="0 0 800 500"' in out
+
+
+def test_tiny_viewbox_is_validated_before_rounding():
+    out = optimize_svg('<svg viewBox="0 0 0.004 0.004"><rect width="0.0012345" height="0.001"/></svg>')
+    assert 'viewBox="0 0 0.004 0.004"' in out
+    assert 'width="0.0012345"' in out
+
+
+def test_coordinates_are_rounded():
+    out = optimize_svg('<svg viewBox="0 0 800 500"><rect x="10.123456789012" y="20.0000001" width="5" height="5"/></svg>')
+    assert '<rect x="10.12" y="20" width="5" height="5"/>' in out
+
+
+def test_large_viewbox_keeps_minimum_decimals():
+    out = optimize_svg('<svg viewBox="0 0 20000 20000"><rect x="10.123456" stroke-width="1.5" font-size="12.5"/></svg>')
+    assert '<rect x="10.12" stroke-width="1.5" font-size="12.5"/>' in out
+
+
+def test_nested_viewbox_is_not_rounded():
+    out = optimize_svg('<svg viewBox="0 0 800 500"><svg viewBox="0 0 0.004 0.004"><rect/></svg></svg>')
+    assert '<svg viewBox="0 0 0.004 0.004">' in out
+
+
+def test_bounding_box_units_are_not_rounded():
+    out = optimize_svg(
+        '<svg viewBox="0 0 20000 20000"><defs>'
+        '<linearGradient id="g" x2="0.123456"><stop offset="0"/></linearGradient>'
+        '<linearGradient id="u" gradientUnits="userSpaceOnUse" x2="10.123456"/>'
+        '<clipPath id="c" clipPathUnits="objectBoundingBox"><rect width="0.123456" height="1"/></clipPath>'
+        '</defs><rect fill="url(#g)"/></svg>'
+    )
+    assert '<linearGradient id="g" x2="0.123456">' in out
+    assert '<linearGradient id="u" gradientUnits="userSpaceOnUse" x2="10.12"/>' in out
+    assert '<rect width="0.123456" height="1"/>' in out
+
+
+def test_transforms_keep_relative_precision():
+    out = optimize_svg('<svg viewBox="0 0 800 500"><g transform="scale(0.004) matrix(0.866025403 0.5 -0.5 0.866 0 0)"><rect/></g></svg>')
+    assert 'transform="scale(0.004) matrix(0.866025 0.5 -0.5 0.866 0 0)"' in out
+
+
+def test_path_rounding_keeps_compact_numbers_apart():
+    out = optimize_svg('<svg viewBox="0 0 100 100"><path d="M1.23456.5L-0.0001 3e2z"/></svg>')
+    assert 'd="M1.23 0.5L0 300z"' in out
+
+
+def test_path_rounding_keeps_arc_flags():
+    out = optimize_svg('<svg viewBox="0 0 100 100"><path d="M10 10a5 5 0 015 5"/></svg>')
+    assert 'd="M10 10a5 5 0 0 1 5 5"' in out
+
+
+def test_invalid_path_data_is_rejected():
+    with pytest.raises(SvgValidationError, match="path data"):
+        optimize_svg('<svg viewBox="0 0 100 100"><path d="M10 10 L x"/></svg>')
+
+
+@pytest.mark.parametrize("d", ["10 10 20 20", "L10 10", "  z"])
+def test_path_without_leading_moveto_is_rejected(d):
+    with pytest.raises(SvgValidationError, match="moveto"):
+        optimize_svg(f'<svg viewBox="0 0 100 100"><path d="{d}"/></svg>')
+
+
+def test_repeated_styles_are_hoisted_into_classes():
+    out = optimize_svg(
+        '<svg viewBox="0 0 100 100">'
+        '<rect style="fill: red; stroke:none;"/><rect class="bar" style="fill:red;stroke:none"/>'
+        '<rect style="fill:blue"/></svg>'
+    )
+    assert "<style>.s0{fill:red;stroke:none}</style>" in out
+    assert '<rect class="s0"/><rect class="bar s0"/>' in out
+    assert '<rect style="fill:blue"/>' in out
+
+
+def test_styles_are_not_hoisted_with_an_author_stylesheet():
+    out = optimize_svg(
+        '<svg viewBox="0 0 100 100"><style>rect{fill:green}</style>'
+        '<rect style="fill:red"/><rect style="fill:red"/></svg>'
+    )
+    assert "s0" not in out
+    assert out.count('style="fill:red"') == 2
+
+
+def test_styles_in_removed_metadata_are_not_counted():
+    out = optimize_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:i="urn:editor" viewBox="0 0 100 100">'
+        '<i:meta><rect style="fill:red"/></i:meta><rect style="fill:red"/></svg>'
+    )
+    assert "<style>" not in out
+    assert 'urn:editor' not in out
+
+
+def test_whitespace_and_comments_are_stripped_outside_text():
+    out = optimize_svg(
+        '<?xml version="1.0"?>\n<!-- chart -->\n'
+        '<svg viewBox="0 0 100 100">\n  <g>\n    <rect/>\n  </g>\n'
+        '  <text>Hello <tspan>big</tspan> world</text>\n</svg>'
+    )
+    assert out == (
+        '<svg viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">'
+        '<g><rect/></g><text>Hello <tspan>big</tspan> world</text></svg>'
+    )
+
+
+def test_space_between_tspans_is_kept():
+    out = optimize_svg('<svg viewBox="0 0 100 100"><text><tspan>Revenue</tspan> <tspan>2024</tspan></text></svg>')
+    assert "<text><tspan>Revenue</tspan> <tspan>2024</tspan></text>" in out
+
+
+def test_xml_space_preserve_is_kept():
+    out = optimize_svg('<svg viewBox="0 0 100 100"><text xml:space="preserve">a   b</text></svg>')
+    assert '<text xml:space="preserve">a   b</text>' in out
+
+
+def test_removed_metadata_keeps_surrounding_text():
+    out = optimize_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:i="urn:editor" viewBox="0 0 100 100">'
+        '<text>A<i:x/> tail</text></svg>'
+    )
+    assert "<text>A tail</text>" in out
+
+
+def test_foreign_object_keeps_xhtml():
+    out = optimize_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><foreignObject width="50" height="20">'
+        '<div xmlns="http://www.w3.org/1999/xhtml">Long <b>label</b></div></foreignObject></svg>'
+    )
+    assert '<div xmlns="http://www.w3.org/1999/xhtml">Long <b>label</b></div>' in out
+
+
+def test_xlink_namespace_is_declared():
+    out = optimize_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 10 10">'
+        '<use xlink:href="#a"/></svg>'
+    )
+    assert '<use xlink:href="#a"/>' in out
+    assert 'xmlns:xlink="http://www.w3.org/1999/xlink"' in out
+
+
+def test_public_doctype_is_stripped():
+    out = optimize_svg(
+        '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">'
+        '<svg viewBox="0 0 10 10"><text>&lt;!ENTITY</text></svg>'
+    )
+    assert "DOCTYPE" not in out
+    assert "<text>&lt;!ENTITY</text>" in out
+
+
+def test_internal_doctype_subset_is_rejected():
+    with pytest.raises(SvgValidationError, match="ENTITY"):
+        optimize_svg('<!DOCTYPE svg [<!ENTITY a "b">]><svg viewBox="0 0 1 1"><text>&a;</text></svg>')
@@ -62,7 +62,12 @@ def display_image(data, mime_type, caption=None):
         svg_code = None
         
         if isinstance(data, str):
-            if "<svg" in data.lower():
+            clean = data.strip()
+            if clean.startswith("<svg") and clean.endswith("</svg>") and clean.count("</svg>") == 1:
+                # Artifacts are already validated <svg> documents; text around it still goes through the regex
+                svg_code = clean
+                is_svg = True
+            elif "<svg" in data.lower():
                 svg_match = re.search(r'<svg.*?</svg>', data, re.DOTALL | re.IGNORECASE)
                 if svg_match:
                     svg_code = svg_match.group(0)
@@ -46,10 +46,12 @@ def display_image(data, mime_type, caption=None):
                 # It's likely base64
                 svg_code = safe_b64decode(data).decode("utf-8", errors="ignore")
             
-            # Extract only the <svg> block
-            svg_match = re.search(r'<svg.*?</svg>', svg_code, re.DOTALL | re.IGNORECASE)
-            if svg_match:
-                svg_code = svg_match.group(0)
+            # Artifacts are already validated <svg> documents; anything else needs the <svg> block extracted
+            svg_code = svg_code.strip()
+            if not (svg_code.startswith("<svg") and svg_code.endswith("</svg>") and svg_code.count("</svg>") == 1):
+                svg_match = re.search(r'<svg.*?</svg>', svg_code, re.DOTALL | re.IGNORECASE)
+                svg_code = svg_match.group(0) if svg_match else None
+            if svg_code:
                 b64_svg = base64.b64encode(svg_code.encode("utf-8")).decode("utf-8")
                 st.markdown(
                     f'<div class="stImage"><img src="data:image/svg+xml;base64,{b64_svg}" style="width:100%"/></div>', 